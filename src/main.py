@@ -18,12 +18,12 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from pathlib import Path
 import logging
-from typing import Literal
-from models import *
-import tkinter.filedialog as tkFd
+from typing import Iterable, Literal
+from models import BackupMeta, BackupFile, BackupDir, ResourcesArray, PROJECT_DIR, all_lists
 import consoletools as ctools
 
 __version__ = "0.3.2"
+_dialog_root = None
 
 class NextRoundAdvice(Exception):
     """
@@ -65,8 +65,48 @@ def check_selected() -> None:
         print("First, you must select a list.")
         raise NextRoundAdvice()
 
+def count_selected(index:int|slice = ...) -> int:
+    """
+    Return the count of resources of the selected list that `index` refers to.
+    """
+    if index == Ellipsis:
+        return len(all_lists.selected)
+    if isinstance(index, int):
+        return 1
+    return len(range(*index.indices(len(all_lists.selected))))
+
+def dialog_root():
+    """
+    Return the hidden window that is the parent of all the dialogs. It is created by the first dialog and then 
+    reused, instead of letting each dialog create and destroy its own Tk interpreter.
+    """
+    global _dialog_root
+    if _dialog_root is None:
+        from tkinter import Tk
+        _dialog_root = Tk()
+        _dialog_root.withdraw()
+    
+    return _dialog_root
+
+def print_results(results:Iterable[tuple[bool, BackupMeta]], total:int) -> None:
+    """
+    Print the results of a backup or a restore of `total` resources of the selected list. The results come in the 
+    order they finish, so each one is printed with its index in the list.
+    """
+    indexes = {id(meta): index for index, meta in enumerate(all_lists.selected)}
+    for done, (result, meta) in enumerate(results, 1):
+        prefix = f'[{done}/{total}] [{indexes[id(meta)]}] "{meta.name}"'
+        if result:
+            print(f'{prefix} was successfully copied.')
+        elif not meta.are_different():
+            print(f'{prefix} has no changes. It was not copied.')
+        else:
+            print(f'{prefix} cannot be copied.')
+
 def get_file() -> tuple[Path, Path]:
+    import tkinter.filedialog as tkFd
     origin = tkFd.askopenfilename(
+        parent= dialog_root(),
         title= "Backup File",
         filetypes= (
             ("Any File", "*.*"), 
@@ -76,25 +116,27 @@ def get_file() -> tuple[Path, Path]:
     if not origin:
         print("The file was not added.")
         raise NextRoundAdvice()
-    origin = Path(origin).resolve(strict= True)
+    origin = Path(origin) # The dialog only returns existing files, it's resolved at the end.
 
-    destiny = Path(tkFd.asksaveasfilename(
+    destiny = tkFd.asksaveasfilename(
+        parent= dialog_root(),
         title= "Backup File Destiny",
         initialfile= "[BACKUP] " + origin.name,
         defaultextension= origin.suffix,
         filetypes= (("*" + origin.suffix, origin.suffix), 
         )
-    ))
+    )
     
     if not destiny:
         print("The file was not added.")
         raise NextRoundAdvice()    
-    destiny = Path(destiny).resolve()
 
-    return (origin, destiny)
+    return (origin.resolve(), Path(destiny).resolve())
 
 def get_dir(*, zip_file:bool = False) -> tuple[Path, Path]:
+    import tkinter.filedialog as tkFd
     origin = tkFd.askdirectory(
+        parent= dialog_root(),
         title= "Backup Dir",
         mustexist= True
     )
@@ -102,10 +144,11 @@ def get_dir(*, zip_file:bool = False) -> tuple[Path, Path]:
     if not origin:
         print("The dir was not added.")
         raise NextRoundAdvice()
-    origin = Path(origin).resolve(strict= True)
+    origin = Path(origin) # The dialog only returns existing dirs, it's resolved at the end.
     
     if zip_file:
         destiny = tkFd.asksaveasfilename(
+            parent= dialog_root(),
             title= "Backup Dir Destiny",
             filetypes= (("Archivo ZIP", "*.zip"), ),
             defaultextension= "*.zip",
@@ -113,6 +156,7 @@ def get_dir(*, zip_file:bool = False) -> tuple[Path, Path]:
         )
     else:
         destiny = tkFd.askdirectory(
+                parent= dialog_root(),
                 title= "Backup Dir Destiny",
                 mustexist= False,
                 initialdir= " [BACKUP] " + origin.name
@@ -121,9 +165,8 @@ def get_dir(*, zip_file:bool = False) -> tuple[Path, Path]:
     if not destiny:
         print("The dir was not added.")
         raise NextRoundAdvice()    
-    destiny = Path(destiny).resolve()
 
-    return (origin, destiny)
+    return (origin.resolve(), Path(destiny).resolve())
 
 def main():
     enter = ctools.prompt(f"[{all_lists.selected_index}] >> ")
@@ -147,7 +190,11 @@ def main():
                 case "dir":
                     compress = enter[2] in ("--compress", "-c")
                     
-                    new_dir = BackupDir(*get_dir(zip_file= compress), compress= compress)
+                    try:
+                        new_dir = BackupDir(*get_dir(zip_file= compress), compress= compress)
+                    except ValueError as exc:
+                        print(f"{exc} The dir was not added.")
+                        return
                     
                     all_lists.selected.add(new_dir)
                     print(f"The dir \"{new_dir.origin.name}\" was added to the list.")
@@ -171,25 +218,13 @@ def main():
             check_selected()
             index = check_index(enter[1], iter= 's') if enter[1] else ...
             print("Creating backups...")
-            for result, meta in all_lists.selected.backup(index):
-                if result:
-                    print(f"\"{meta.name}\" was successfully copied.")
-                elif not meta.are_different():
-                    print(f'"{meta.name}" has no changes. It was not copied.')
-                else:
-                    print(f"\"{meta.name}\" cannot be copied.")
+            print_results(all_lists.selected.backup(index), count_selected(index))
                     
         case "restore":
             check_selected()
             index = check_index(enter[1], iter= 's') if enter[1] else ...
             print("Restoring...")
-            for result, meta in all_lists.selected.restore(index):
-                if result:
-                    print(f"\"{meta.name}\" was successfully copied.")
-                elif not meta.are_different():
-                    print(f'"{meta.name}" has no changes. It was not copied.')
-                else:
-                    print(f"\"{meta.name}\" cannot be copied.")
+            print_results(all_lists.selected.restore(index), count_selected(index))
                     
         case "list":
             match enter[1]:
@@ -229,7 +264,9 @@ def main():
                     print(f"Created list \"{name}\".")
                     
                 case "import":
+                    import tkinter.filedialog as tkFd
                     path = tkFd.askopenfilename(
+                        parent= dialog_root(),
                         title= "Import List",
                         filetypes= (("JSON File", "*.json"), ),
                         defaultextension= "*.json"
@@ -257,7 +294,9 @@ def main():
                 case "export":
                     index = check_index(enter[2], allow_slice= False)
 
+                    import tkinter.filedialog as tkFd
                     path = tkFd.asksaveasfilename(
+                        parent= dialog_root(),
                         title= "Export List",
                         filetypes= (("JSON File", "*.json"), ),
                         defaultextension= "*.json",
@@ -350,20 +389,22 @@ if __name__ == "__main__":
     try:
         from sys import platform
         if platform == "win32":    
-            from ctypes import windll
-            windll.shcore.SetProcessDpiAwareness(1) # To avoid blurred windows
+            from ctypes import windll, c_void_p
+            # To avoid blurred windows. Per monitor v2 (-4) keeps the dialogs sharp when they are moved to a monitor
+            # with another DPI, but it needs Windows 10 1703 or later.
+            try:
+                dpi_aware = windll.user32.SetProcessDpiAwarenessContext(c_void_p(-4))
+            except AttributeError:
+                dpi_aware = False
+            if not dpi_aware:
+                windll.shcore.SetProcessDpiAwareness(2)
 
-        if not PROJECT_DIR.exists():
-            PROJECT_DIR.mkdir()
-            PROJECT_DIR.joinpath("logs").mkdir()
+        PROJECT_DIR.joinpath("logs").mkdir(parents= True, exist_ok= True)
             
-        with PROJECT_DIR.joinpath("logs/Last Log.log") as log_path:
-            if log_path.exists():
-                from os import remove
-                remove(log_path)
-                
-            logging.basicConfig(filename= log_path, level= logging.INFO, 
-                                format= "[%(asctime)s] %(levelname)s: %(message)s", datefmt= "%b %d, %Y %H:%M:%S")
+        # The last log is overwritten.
+        logging.basicConfig(filename= PROJECT_DIR.joinpath("logs/Last Log.log"), filemode= "w", encoding= "utf-8", 
+                            level= logging.INFO, 
+                            format= "[%(asctime)s] %(levelname)s: %(message)s", datefmt= "%b %d, %Y %H:%M:%S")
         
         logging.info("Starting...")
         logging.info(f"Working in {platform!r}. \n"
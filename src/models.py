@@ -20,8 +20,9 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from pathlib import Path, PurePath
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from consoletools import format_delta, format_number, format_size
-import os, logging, sys, pickle, json, zipfile
+import os, logging, sys, json, zipfile
 import typing as typ, datetime as dt, shutil as sh
 
 __all__ = ["BackupMeta", "BackupFile", "BackupDir", "PROJECT_DIR", "ResourcesArray", "all_lists"]
@@ -29,6 +30,56 @@ _AT = typ.TypeVar("_AT")
 
 PROJECT_DIR:Path = Path(os.getenv("APPDATA") + "/Nicko's Backup Manager") if sys.platform == "win32" else \
     Path.home() / ".Nicko's Backup Manager"
+LISTS_PATH:Path = PROJECT_DIR / "all_lists.json"
+FILES_PATH:Path = PROJECT_DIR / "files.json"
+# The binary files of old versions
+OLD_LISTS_PATH:Path = PROJECT_DIR / "all_lists"
+OLD_FILES_PATH:Path = PROJECT_DIR / "files"
+
+CHUNK_SIZE = 1024 * 1024 # The size of the buffers used to read the files.
+MAX_WORKERS = 8 # The max count of resources that are copied at the same time.
+ZIP_LEVEL = 1 # The compression level of the compressed dirs. Higher levels cost much more CPU for a little gain.
+
+def _readinto(stream:typ.BinaryIO, buffer:memoryview) -> int:
+    """
+    Fill `buffer` with the data of `stream` and return the count of bytes read. It is only less than the size of 
+    the buffer when the end of the stream is reached.
+    """
+    total = 0
+    while total < len(buffer):
+        read = stream.readinto(buffer[total:])
+        if not read:
+            break
+        total += read
+        
+    return total
+
+def _walk(root:os.PathLike) -> typ.Generator[tuple[str, str], None, None]:
+    """
+    Walk over the files in `root` and its subdirectories, like `os.walk` does, and yield the path of each file and 
+    its path relative to `root`. The paths are built as strings while descending, so they are never re-parsed. 
+    Symlinks to directories are skipped, as `os.walk` does.
+    """
+    pending = [(os.fspath(root), "")]
+    while pending:
+        path, rel_path = pending.pop()
+        try:
+            entries = os.scandir(path)
+        except OSError:
+            continue
+        
+        with entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    yield entry.path, rel_path + entry.name
+                elif not entry.is_symlink():
+                    pending.append((entry.path, rel_path + entry.name + os.sep))
+
+def _count_files(root:os.PathLike) -> int:
+    """
+    Count the files in `root` and its subdirectories.
+    """
+    return sum(1 for _ in _walk(root))
 
 class BackupMeta(ABC):
     
@@ -45,6 +96,7 @@ class BackupMeta(ABC):
         self = object.__new__(cls)
         self._origin = Path(dictt['origin_path'])
         self._destiny = Path(dictt['destiny_path'])
+        self._hash = None
         if dictt.get('last', None) and dictt['last']:
             self._last_backup = dt.datetime.fromtimestamp(dictt['last'])
         else:
@@ -174,13 +226,12 @@ class BackupMeta(ABC):
         return state
     
     def __setstate__(self, state:dict):
+        # The subclasses' __init__ are not called, so the unpickling doesn't check the paths.
         if "for_init" in state.keys():
-            self.__init__(**state['for_init'])
-            self._last_backup = state.get('last', None)
+            BackupMeta.__init__(self, state['for_init']['origin_path'], state['for_init']['destiny_path'])
         else: # Support for old versions
-            if "origin_path" in state.keys() and "destiny_path" in state.keys():
-                self.__init__(**state)
-            self._last_backup = state.get('last', None)
+            BackupMeta.__init__(self, state.get('origin_path', None), state.get('destiny_path', None))
+        self._last_backup = state.get('last', None)
             
     def __enter__(self):
         return self
@@ -227,12 +278,12 @@ class BackupFile(BackupMeta):
     @classmethod
     def from_dict(cls, dictt: dict):
         self = super().from_dict(dictt)
-        self._at = dictt.get('at_path', None)
+        self._at = PurePath(dictt['at_path']) if dictt.get('at_path', None) else None
         return self
     
     def to_dict(self) -> dict:
         dictt = super().to_dict()
-        dictt['at_path'] = self._at
+        dictt['at_path'] = self._at.as_posix() if self._at else None
         return dictt
     
     @property
@@ -265,32 +316,56 @@ class BackupFile(BackupMeta):
         if not (self._origin.exists() and self._destiny.exists()):
             return True
         
-        origin_mtime = dt.datetime.fromtimestamp(trunc(self._origin.stat().st_mtime))
-        destiny_mtime = dt.datetime.fromtimestamp(trunc(self._destiny.stat().st_mtime))
-        
-        dfp = self._destiny.open('rb')
+        origin_stat = self._origin.stat()
+        origin_mtime = dt.datetime.fromtimestamp(trunc(origin_stat.st_mtime))
         
-        if zipfile.is_zipfile(self._destiny):
+        if self._at and zipfile.is_zipfile(self._destiny):
             at_path = self._at.as_posix()
             with zipfile.ZipFile(self._destiny) as fp:
                 if not at_path in fp.namelist():
                     return True # The file doesn't exists.
-                destiny_mtime = dt.datetime(*fp.getinfo(at_path).date_time)
-                dfp.close()
-                dfp = fp.open(at_path, 'r')
+                info = fp.getinfo(at_path)
+                destiny_mtime = dt.datetime(*info.date_time)
+                if -1 < (origin_mtime - destiny_mtime).total_seconds() > 1 or info.file_size != origin_stat.st_size:
+                    return True
+                
+                if strict:
+                    with fp.open(at_path, 'r') as dfp:
+                        return not self._same_content(dfp)
+                return False
+        
+        destiny_stat = self._destiny.stat()
+        destiny_mtime = dt.datetime.fromtimestamp(trunc(destiny_stat.st_mtime))
         
-        # Check the mtime diff
-        if -1 < (origin_mtime - destiny_mtime).total_seconds() > 1:
+        # Check the mtime and size diffs
+        if -1 < (origin_mtime - destiny_mtime).total_seconds() > 1 or destiny_stat.st_size != origin_stat.st_size:
             return True        
         
         if strict:
-            with dfp, self._origin.open("rb") as ofp:
-                if ofp.read() != dfp.read():
-                    return True
+            with self._destiny.open("rb", buffering= 0) as dfp:
+                return not self._same_content(dfp)
         
-        dfp.close()
         return False
     
+    def _same_content(self, dfp:typ.BinaryIO) -> bool:
+        """
+        Compare the content of the origin with `dfp` chunk by chunk, reusing the same buffers.
+        """
+        obuf, dbuf = bytearray(CHUNK_SIZE), bytearray(CHUNK_SIZE)
+        oview, dview = memoryview(obuf), memoryview(dbuf)
+        
+        with self._origin.open("rb", buffering= 0) as ofp:
+            while True:
+                o_read = _readinto(ofp, oview)
+                d_read = _readinto(dfp, dview)
+                if o_read != d_read:
+                    return False
+                if o_read < CHUNK_SIZE: # The last chunk
+                    return obuf[:o_read] == dbuf[:d_read]
+                # Compare the bytearrays, not the memoryviews, which are compared byte by byte.
+                if obuf != dbuf:
+                    return False
+    
     def backup(self, force:bool = False) -> bool: #TODO: Implement ext-file support.
         if self.is_extfile():
             logging.info("Tried to backup an ext-file.")
@@ -301,18 +376,18 @@ class BackupFile(BackupMeta):
             return False
         
         if not force and not self.are_different():
-            logging.info(f"{self.name!r} has not been changed.")
+            logging.info("%r has not been changed.", self.name)
             return False
         
         try:
             self._destiny.parent.mkdir(parents= True, exist_ok= True)
             sh.copy2(self._origin, self._destiny)
             self._last_backup = dt.datetime.now()
-            logging.info(f"{self.name!r} was successfully backuped.")
+            logging.info("%r was successfully backuped.", self.name)
             return True
         except BaseException as exc:
             logging.exception(exc)
-            logging.info(f"{self.name!r} wasn't backuped.")
+            logging.info("%r wasn't backuped.", self.name)
             return False
         
     def restore(self, force:bool = False) -> bool: #TODO: Implement ext-file support.
@@ -325,16 +400,16 @@ class BackupFile(BackupMeta):
             return False
         
         if not force and not self.are_different():
-            logging.info(f"{self.name!r} has not been changed.")
+            logging.info("%r has not been changed.", self.name)
             return False
 
         try:
             self._origin.parent.mkdir(parents= True, exist_ok= True)
             sh.copy2(self._destiny, self._origin)
-            logging.info(f"{self._destiny.name!r} was successfully restored.")
+            logging.info("%r was successfully restored.", self._destiny.name)
             return True
         except BaseException as exc:
-            logging.info(f"{self._destiny.name!r} wasn't restored.")
+            logging.info("%r wasn't restored.", self._destiny.name)
             logging.exception(exc)
             return False
         
@@ -373,7 +448,10 @@ class BackupDir(BackupMeta):
         return self._hash
     
     def __init__(self, origin_path: Path, destiny_path: Path = ..., *, compress:bool = False) -> None:
-        assert origin_path.suffix != ".zip"
+        if origin_path.suffix == ".zip":
+            raise ValueError(
+                "The origin of a dir cannot be a zip file."
+            )
         super().__init__(origin_path, destiny_path)
         self._compress = compress
         
@@ -396,11 +474,7 @@ class BackupDir(BackupMeta):
         """
         The count of all the files in the directory.
         """
-        count = 0
-        for _, _, files in os.walk(self._origin):
-            count += len(files)
-            
-        return count
+        return _count_files(self._origin)
     
     @property
     def compress(self) -> bool:
@@ -446,18 +520,26 @@ class BackupDir(BackupMeta):
     def backup(self, force:bool = False, falses:typ.Literal['ignore', 'return'] = 'return') -> bool:
         falses = falses.lower()
         assert falses in ('ignore', 'return')
-        if not force and not self.are_different():
-            logging.info(f"{self.name!r} has not been changed.")
-            return False
-        
         if self._compress:
+            if not force and not self.are_different():
+                logging.info(f"{self.name!r} has not been changed.")
+                return False
             return self._save_compressed()
     
         try:
+            copied = force
             for file in self.walk('o'):
-                file.destiny.parent.mkdir(parents= True, exist_ok= True)
-                if not file.backup(force) and falses == 'return':
+                if not force and not file.are_different():
+                    continue # Only the changed files are copied.
+                
+                if file.backup(force= True):
+                    copied = True
+                elif falses == 'return':
                     return False
+            
+            if not copied:
+                logging.info(f"{self.name!r} has not been changed.")
+                return False
                 
             self._last_backup = dt.datetime.now()
             return True
@@ -468,19 +550,27 @@ class BackupDir(BackupMeta):
     def restore(self, force:bool = False, falses:typ.Literal['ignore', 'return'] = 'return') -> bool:
         falses = falses.lower()
         assert falses in ('ignore', 'return')
-        if not force and not self.are_different():
-            logging.info(f"{self.name!r} has not been changed.")
-            return False
         
         try:
             if self._destiny.is_dir():
+                copied = force
                 for file in self.walk('d'):
-                    file.origin.parent.mkdir(parents= True, exist_ok= True)
-                    if not file.restore() and falses == 'return':
+                    if not force and not file.are_different():
+                        continue # Only the changed files are copied.
+                    
+                    if file.restore(force= True):
+                        copied = True
+                    elif falses == 'return':
                         return False
                 
-                return True
+                if not copied:
+                    logging.info(f"{self.name!r} has not been changed.")
+                return copied
             else:
+                if not force and not self.are_different():
+                    logging.info(f"{self.name!r} has not been changed.")
+                    return False
+                
                 with zipfile.ZipFile(self._destiny) as zip_fp:
                     zip_fp.extractall(self._origin)
             
@@ -511,10 +601,9 @@ class BackupDir(BackupMeta):
             destiny = self._destiny
             
         try:        
-            with zipfile.ZipFile(destiny, "w") as zip_stream:
-                for path, _, files in os.walk(self._origin):
-                    for file in files:
-                        zip_stream.write(Path(path) / file, (Path(path) / file).relative_to(self._origin))
+            with zipfile.ZipFile(destiny, "w", zipfile.ZIP_DEFLATED, compresslevel= ZIP_LEVEL) as zip_stream:
+                for path, at_path in _walk(self._origin):
+                    zip_stream.write(path, at_path)
             
             self._last_backup = dt.datetime.now()
             return True 
@@ -531,18 +620,18 @@ class BackupDir(BackupMeta):
         
         if zipfile.is_zipfile(src):
             with zipfile.ZipFile(src) as fp:
-                for file in fp.namelist():
-                    if fp.getinfo(file).is_dir():
+                for info in fp.infolist():
+                    if info.is_dir():
                         continue
                     
-                    yield BackupFile.in_dir(self._origin / file, self._destiny, PurePath(file))
+                    at = PurePath(info.filename)
+                    yield BackupFile.in_dir(self._origin / at, self._destiny, at)
         else:
-            for path, dirs, files in os.walk(src):              
-                for file in files:
-                    at = PurePath(path).joinpath(file).relative_to(src)
-                    yield BackupFile.in_dir(self._origin / at,
-                                            self._destiny / (at if not self.destiny.suffix == '.zip' else ''), 
-                                            at)
+            # The files of a zip destiny are all in the same path
+            zipped = self._destiny.suffix == '.zip'
+            for _, at_path in _walk(src):
+                at = PurePath(at_path)
+                yield BackupFile.in_dir(self._origin / at, self._destiny if zipped else self._destiny / at, at)
     @typ.overload
     def where(self, 
               filter:typ.Callable[[BackupFile], bool],
@@ -578,6 +667,10 @@ class BackupDir(BackupMeta):
         state = super().__getstate__()
         state['for_init']['compress'] = self._compress
         return state
+    
+    def __setstate__(self, state: dict):
+        super().__setstate__(state)
+        self._compress = state.get('for_init', state).get('compress', False)
 
     def __eq__(self, value) -> bool:
         return super().__eq__(value) and self._compress == value._compress
@@ -618,6 +711,9 @@ class ResourcesArray(typ.Sequence[BackupMeta]):
     """
     Base class for arrays of paths of files or directories that will be copied.
     """
+    
+    __slots__ = ['name', '_data']
+    
     def __init__(self, name:str = "") -> None:
         self.name = name
         
@@ -628,21 +724,25 @@ class ResourcesArray(typ.Sequence[BackupMeta]):
         with open(path, "r") as fp:
             loaded:dict = json.load(fp)
         
-        if not isinstance(loaded, dict):
+        return cls.from_dict(loaded)
+    
+    @classmethod
+    def from_dict(cls, dictt:dict):
+        if not isinstance(dictt, dict):
             raise TypeError(
                 "The loaded data is not a dict."
             )
                 
         self = object.__new__(cls)
-        self.name = loaded.get("list_name", "")
+        self.name = dictt.get("list_name", "")
         
         self._data = []
-        for dictt in loaded.get("content", []):
-            dictt:dict
-            if dictt['type'] == "dir":
-                self._data.append(BackupDir.from_dict(dictt))
-            elif dictt['type'] == "file":
-                self._data.append(BackupFile.from_dict(dictt))
+        for meta_dict in dictt.get("content", []):
+            meta_dict:dict
+            if meta_dict['type'] == "dir":
+                self._data.append(BackupDir.from_dict(meta_dict))
+            elif meta_dict['type'] == "file":
+                self._data.append(BackupFile.from_dict(meta_dict))
         
         return self        
         
@@ -651,9 +751,9 @@ class ResourcesArray(typ.Sequence[BackupMeta]):
         """
         The total of files in the array. It is not the same as 'len'.
         """
-        total = len(self.files_only())
-        for backup_dir in self.dirs_only():
-            total += backup_dir.file_count
+        total = 0
+        for meta in self._data:
+            total += meta.file_count if isinstance(meta, BackupDir) else 1
             
         return total
     
@@ -697,10 +797,12 @@ class ResourcesArray(typ.Sequence[BackupMeta]):
     def pop(self, index:int|slice) -> typ.Generator[BackupMeta, None, None]:
         if isinstance(index, int):
             index = slice(index, index + 1)
-            
-        for meta in self._data[index]:
-            self._data.remove(meta)
-            yield meta
+        
+        # Delete the whole slice at once. Removing the resources one by one is quadratic, and `list.remove` could
+        # delete an equal resource that is not in the slice.
+        popped = self._data[index]
+        del self._data[index]
+        yield from popped
     
     def remove(self, value:BackupMeta) -> None:
         self._data.remove(value)
@@ -711,23 +813,28 @@ class ResourcesArray(typ.Sequence[BackupMeta]):
     
     def backup(self, index:int|slice = ..., *, force:bool = False) -> typ.Generator[tuple[bool, BackupMeta], None, None]:
         """
-        Backup resources of the array.
+        Backup resources of the array. The resources are copied concurrently, so they are yielded in the order 
+        they finish.
         """
-        if isinstance(index, int):
-            index = slice(index, index + 1)
-        elif index == Ellipsis:
-            index = slice(0, None)
-        
-        data = self._data[index]
-        
         logging.info(f"Starting backups of {self.name!r}...")
-        for meta in data:
-            yield (meta.backup(force= force), meta)
+        yield from self._run_concurrently(index, lambda meta: meta.backup(force= force))
         logging.info(f"The backup of {self.name!r} has ended.")
         
     def restore(self, index:int|slice = ..., *, force:bool = False) -> typ.Generator[tuple[bool, BackupMeta], None, None]:
         """
-        Restore resources of the array.
+        Restore resources of the array. The resources are copied concurrently, so they are yielded in the order 
+        they finish.
+        """
+        logging.info(f"Starting restore of {self.name!r}...")
+        yield from self._run_concurrently(index, lambda meta: meta.restore(force= force))
+        logging.info(f"The restoring of {self.name!r} has ended.")
+        
+    def _run_concurrently(self, 
+                          index:int|slice, 
+                          func:typ.Callable[[BackupMeta], bool]
+    ) -> typ.Generator[tuple[bool, BackupMeta], None, None]:
+        """
+        Call `func` with each resource of `self[index]` in a thread pool and yield the results as they are completed.
         """
         if isinstance(index, int):
             index = slice(index, index + 1)
@@ -735,18 +842,25 @@ class ResourcesArray(typ.Sequence[BackupMeta]):
             index = slice(0, None)
         
         data = self._data[index]
+        if not data:
+            return
         
-        logging.info(f"Starting restore of {self.name!r}...")
-        for meta in data:
-            yield (meta.restore(force= force), meta)
-        logging.info(f"The restoring of {self.name!r} has ended.")
+        with ThreadPoolExecutor(max_workers= min(MAX_WORKERS, len(data))) as executor:
+            futures = {executor.submit(func, meta): meta for meta in data}
+            try:
+                for future in as_completed(futures):
+                    yield (future.result(), futures[future])
+            finally:
+                # If the loop is interrupted (e.g. Ctrl+C or an error), only the running copies are waited for.
+                for future in futures:
+                    future.cancel()
     
     def files_only(self):
         """
         Return a copy of the array with files only.
         """
         new = ResourcesArray(self.name)
-        new._data = list(filter(lambda x: isinstance(x, BackupFile), self._data))
+        new._data = [meta for meta in self._data if isinstance(meta, BackupFile)]
         return new
     
     def dirs_only(self):
@@ -754,7 +868,7 @@ class ResourcesArray(typ.Sequence[BackupMeta]):
         Return a copy of the array with dirs only.
         """
         new = ResourcesArray(self.name)
-        new._data = list(filter(lambda x: isinstance(x, BackupDir), self._data))
+        new._data = [meta for meta in self._data if isinstance(meta, BackupDir)]
         return new
 
     def copy(self):
@@ -767,26 +881,41 @@ class ResourcesArray(typ.Sequence[BackupMeta]):
     
     def save(self, *, path:Path = ...) -> None:
         """
-        Save the array in a binary file.
+        Save the array in a json file.
         """
         if path == Ellipsis:
-            path = PROJECT_DIR / "files"
+            path = FILES_PATH
         
         logging.info(f"Saving the array on '{path}'...")
-        with path.open("wb") as stream:
-            pickle.dump(self, stream)
+        path.write_text(json.dumps(self.to_dict()), encoding= "utf-8")
         
     def load(self, *, path:Path = ...) -> None:
         """
-        Load the array from a binary file.
+        Load the array from a json file. If there is not a path, the binary file of old versions is also searched.
         """
         if path == Ellipsis:
-            path = PROJECT_DIR / "files"
+            path = FILES_PATH
+            if not path.exists():
+                return self._load_pickle(OLD_FILES_PATH)
         
         if not path.exists():
             logging.warning(f"The array from '{path}' wasn't loaded because the file doesn't exists.")
             return
         
+        logging.info(f"Loading the array from '{path}'...")
+        data = type(self).from_dict(json.loads(path.read_text(encoding= "utf-8")))
+        self._data = data._data
+        self.name = data.name
+    
+    def _load_pickle(self, path:Path) -> None:
+        """
+        Load the array from a binary file saved by an old version.
+        """
+        if not path.exists():
+            logging.warning(f"The array from '{path}' wasn't loaded because the file doesn't exists.")
+            return
+        
+        import pickle
         logging.info(f"Loading the array from '{path}'...")
         with path.open("rb") as stream:
             data = pickle.load(stream)
@@ -798,31 +927,31 @@ class ResourcesArray(typ.Sequence[BackupMeta]):
         """
         Return all the reports of the resources in the array in a string.
         """
-        report = ""
         if len(self._data) == 0:
             return "The list is empty"
         
-        for index, file in enumerate(self._data):
-            report += file.report(index)
-            
-            # If the file is not the last in the list, print a space
-            if self._data.index(file) < len(self._data) - 1:
-                report += "\n"
-                
-        report += f"\n\nTOTAL FILES: {format_number(self.total_files)}\n"
-        report += f"TOTAL SIZE:  {format_size(self.total_size)}"
+        # The totals are separated from the reports by a blank line
+        reports = [meta.report(index) for index, meta in enumerate(self._data)]
+        reports.append(f"\nTOTAL FILES: {format_number(self.total_files)}\n"
+                       f"TOTAL SIZE:  {format_size(self.total_size)}")
         
-        return report
+        return "\n".join(reports)
     
     def export(self, destiny:os.PathLike) -> None:
         """
         Serialize the Array to a json object.
         """
         with open(destiny, "w", encoding= "utf-8") as fp:
-            json.dump({
-                "list_name": self.name,
-                "content": [meta.to_dict() for meta in self._data]
-            }, fp, indent= 4, )
+            json.dump(self.to_dict(), fp, indent= 4, )
+    
+    def to_dict(self) -> dict[str, typ.Any]:
+        """
+        Return self represented in a dict.
+        """
+        return {
+            "list_name": self.name,
+            "content": [meta.to_dict() for meta in self._data]
+        }
     
     def __iter__(self) -> typ.Iterator[BackupMeta]:
         return iter(self._data)
@@ -845,10 +974,19 @@ class ResourcesArray(typ.Sequence[BackupMeta]):
     def __repr__(self) -> str:
         return type(self).__name__ + f"(name= {self.name})"
     
+    def __setstate__(self, state:dict|tuple):
+        if isinstance(state, tuple): # (__dict__, slots)
+            state = {**(state[0] or {}), **state[1]}
+        
+        # Support for old versions, that were pickled with a __dict__
+        self.name = state.get('name', "")
+        self._data = state.get('_data', [])
+    
 # Convert PathBackupArrays to ResourcesArrays
 class PathBackupArray(ResourcesArray):
     def __new__(cls):
-        return super().__new__().copy()
+        # Pickle sets the state on the returned object, so a bare ResourcesArray is returned
+        return ResourcesArray.__new__(ResourcesArray)
 
 class _AllLists():
     #TODO: Optimize this. When a resource array is requested, it should be loaded. If it is not requested, it is not loaded.
@@ -874,18 +1012,44 @@ class _AllLists():
         return str(self._data.index(self._selected))
         
     def load(self):
-        if not PROJECT_DIR.joinpath("all_lists").exists():
+        """
+        Load the lists from the project dir. The lists saved by old versions in a binary file are also loaded.
+        """
+        if not LISTS_PATH.exists():
+            return self._load_pickle()
+        
+        loaded:dict = json.loads(LISTS_PATH.read_text(encoding= "utf-8"))
+        self._data = [ResourcesArray.from_dict(dictt) for dictt in loaded.get("lists", [])]
+        
+        selected = loaded.get("selected", None)
+        if isinstance(selected, int) and 0 <= selected < len(self._data):
+            self._selected = self._data[selected]
+        else:
+            self._selected = None
+    
+    def _load_pickle(self):
+        """
+        Load the lists from the binary file of old versions.
+        """
+        if not OLD_LISTS_PATH.exists():
             return
         
-        with PROJECT_DIR.joinpath("all_lists").open("rb") as fp:
+        import pickle
+        with OLD_LISTS_PATH.open("rb") as fp:
             data:_AllLists = pickle.load(fp)
             if isinstance(data, _AllLists) and isinstance(data._data, list):
                 self._data = data._data
                 self._selected = data._selected
     
     def save(self):
-        with PROJECT_DIR.joinpath("all_lists").open("wb") as fp:
-            pickle.dump(self, fp)
+        """
+        Save the lists in a json file in the project dir.
+        """
+        data = json.dumps({
+            "selected": self._data.index(self._selected) if self._selected is not None else None,
+            "lists": [array.to_dict() for array in self._data]
+        })
+        LISTS_PATH.write_text(data, encoding= "utf-8")
     
     def add(self, value:ResourcesArray):
         assert isinstance(value, ResourcesArray)